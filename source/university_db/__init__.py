@@ -19,25 +19,13 @@ Example usage:
         print(f"Student: {student}")
 """
 
-from .db_handler import (
-    AdminQueryHandler,
-    UniversityData,
-    Fetch,
-    InvalidEmail,
-    UnsupportedDateFormat,
-    IncorrectTimeslot,
-    IncorrectValue,
-    DataBaseError,
-    RecordNotFound,
-    populate
-)
-
 __version__ = "1.0.0"
 
 # Package metadata
 __all__ = [
     # Main classes
     "AdminQueryHandler",
+    "MemoryAdminHandler",
     "UniversityData",
     
     # Enums
@@ -52,36 +40,98 @@ __all__ = [
     "RecordNotFound",
     
     # Utilities
-    "populate"
+    "populate",
+    "shutdown_pool"
 ]
 
+# Everything from db_handler is re-exported lazily (PEP 562): importing the
+# package costs nothing until a name is first used, which keeps cold CLI
+# startup off the hook for parsing db_handler and its imports.
+_LAZY = frozenset({
+    "AdminQueryHandler",
+    "MemoryAdminHandler",
+    "UniversityData",
+    "Fetch",
+    "InvalidEmail",
+    "UnsupportedDateFormat",
+    "IncorrectTimeslot",
+    "IncorrectValue",
+    "DataBaseError",
+    "RecordNotFound",
+    "populate",
+    "shutdown_pool",
+    "EMAIL_RE",
+    "GRADE_POINTS",
+    "SUPPORTED_SEMESTERS",
+    "VALID_GRADES",
+    "VALID_GRADES_ORDERED",
+    "VALID_RANKS",
+    "VALID_STATUSES",
+})
+
+def __getattr__(name):
+    if name in _LAZY:
+        from . import db_handler
+        return getattr(db_handler, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(set(globals()) | _LAZY)
+
 # Package level constants
+# The VALID_* / SUPPORTED_* value sets are defined in db_handler (as
+# frozensets, next to the validators that use them) and re-exported here.
 DEFAULT_DB_NAME = "university.db"
-SUPPORTED_SEMESTERS = ["Fall", "Winter", "Spring", "Summer"]
-VALID_GRADES = ["A+", "A", "A-", "B+", "B", "B-", "C+", "C", "C-", "D+", "D", "F"]
-VALID_RANKS = ["Assistant Professor", "Associate Professor", "Professor", "Lecturer", "Adjunct"]
-VALID_STATUSES = ["Active", "Inactive", "Graduated", "Suspended"]
 
-def get_version():
-    """Return the current version of the university database package."""
-    return __version__
+# Prefer reading __version__ directly; get_version is kept as a trivial
+# alias for backward compatibility.
+get_version = __version__.__str__
 
-def create_database(db_path: str = None):
+def create_database(db_path: str = None, pragmas: dict = None,
+                    deferred_indexes: bool = False):
     """
     Convenience function to create a new university database.
-    
+
     Args:
         db_path (str, optional): Path to database file. Defaults to 'university.db'
-        
+        pragmas (dict, optional): Overrides for the default connection pragmas
+            (e.g., {"synchronous": "FULL"})
+        deferred_indexes (bool, optional): Skip index creation on a fresh
+            database so a bulk load can build them afterwards (populate does
+            this automatically)
+
     Returns:
         AdminQueryHandler: Database handler instance
-        
+
     Example:
         db = create_database("my_university.db")
         with db:
             # Use database operations
             pass
     """
+    from .db_handler import AdminQueryHandler
+    if db_path is None:
+        db_path = DEFAULT_DB_NAME
+    return AdminQueryHandler(db_path, pragmas, deferred_indexes)
+
+def create_database_fast(db_path: str = None, pragmas: dict = None,
+                         deferred_indexes: bool = False):
+    """
+    Like create_database, but builds the database in memory and writes it
+    to db_path in one backup pass when the handler is closed. Much faster
+    for bulk builds since no page I/O happens until the end.
+
+    Args:
+        db_path (str, optional): Path the finished database is written to.
+            Defaults to 'university.db'
+        pragmas (dict, optional): Overrides for the default connection pragmas
+        deferred_indexes (bool, optional): Skip index creation until after
+            the bulk load
+
+    Returns:
+        MemoryAdminHandler: In-memory database handler instance
+    """
+    from .db_handler import MemoryAdminHandler
     if db_path is None:
         db_path = DEFAULT_DB_NAME
-    return AdminQueryHandler(db_path)
+    return MemoryAdminHandler(db_path, pragmas, deferred_indexes)
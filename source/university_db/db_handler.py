@@ -1,15 +1,162 @@
 import sqlite3
 import os
 import re
-from typing import Any, Union, Optional, Dict, List, Tuple
+import json
+import logging
+import functools
+import threading
+from typing import Any, Union, Optional, Dict, Iterator, List, Tuple
 from abc import ABC
+from collections import OrderedDict
+from contextlib import contextmanager
 from enum import Enum
 from datetime import datetime
 
 
-class Fetch(Enum): 
+logger = logging.getLogger(__name__)
+
+
+# Valid values for the constrained columns. Frozensets make the per-insert
+# membership checks single hash lookups instead of list scans; the ordered
+# grade tuple is kept for callers that care about ranking.
+SUPPORTED_SEMESTERS = frozenset({"Fall", "Winter", "Spring", "Summer"})
+VALID_STATUSES = frozenset({"Active", "Inactive", "Graduated", "Suspended"})
+VALID_GRADES_ORDERED = ("A+", "A", "A-", "B+", "B", "B-", "C+", "C", "C-", "D+", "D", "F")
+VALID_GRADES = frozenset(VALID_GRADES_ORDERED)
+VALID_RANKS = frozenset({"Assistant Professor", "Associate Professor",
+                         "Professor", "Lecturer", "Adjunct"})
+
+# Updatable (or searchable) column sets per table, used by the update_* /
+# search methods to reject unknown field kwargs without rebuilding a set
+# on every call.
+_DEPT_FIELDS = frozenset({"phone", "budget", "building", "dean_name"})
+_STUDENT_FIELDS = frozenset({"fname", "lname", "dept_name", "major", "tot_cred",
+                             "email", "enrollment_date", "status"})
+_STUDENT_SEARCH_FIELDS = _STUDENT_FIELDS | {"id"}
+_INSTRUCTOR_FIELDS = frozenset({"fname", "lname", "dept_name", "academic_rank",
+                                "salary", "email", "hire_date", "office_number"})
+_COURSE_FIELDS = frozenset({"title", "credits", "dept_name", "description"})
+_SECTION_FIELDS = frozenset({"time_slot", "room", "capacity", "enrolled"})
+
+# Grade -> grade-point mapping, built once at import so GPA computations do
+# plain dict lookups instead of rebuilding the table per call.
+GRADE_POINTS = {
+    'A+': 4.0, 'A': 4.0, 'A-': 3.7,
+    'B+': 3.3, 'B': 3.0, 'B-': 2.7,
+    'C+': 2.3, 'C': 2.0, 'C-': 1.7,
+    'D+': 1.3, 'D': 1.0, 'F': 0.0
+}
+
+# SQL CASE expression mirroring GRADE_POINTS, so GPA sums can run entirely
+# inside SQLite instead of shipping every (credits, grade) row to Python.
+_GPA_CASE_SQL = ("CASE t.grade "
+                 + " ".join(f"WHEN '{grade}' THEN {points}"
+                            for grade, points in GRADE_POINTS.items())
+                 + " END")
+
+# Compiled once at import so per-record validation skips the re-cache lookup.
+EMAIL_RE = re.compile(r"[^@]+@[^@]+\.[^@]+$")
+_TIMESLOT_RE = re.compile(
+    r"^([MTWFS]|Th|Su|TTh|MWF|MW|TR|WF)\s"
+    r"([01]?[0-9]|2[0-3]):[0-5][0-9]-([01]?[0-9]|2[0-3]):[0-5][0-9]$"
+)
+
+_READ_CACHE_SIZE = 1024
+
+# Batch sizes for the pre-generated multi-row INSERT statements, largest
+# first. Sized so the widest statement stays under SQLite's conservative
+# 999 bound-parameter limit (128 rows x 6 columns = 768 parameters).
+_BATCH_SIZES = (128, 32, 8, 1)
+
+
+def cached_read(method):
+    """
+    Memoize a point-read method on (method name, args).
+
+    A cache hit costs zero SQL round-trips. Entries are validated against
+    the database's write-generation counter, which every mutation bumps;
+    the counter is shared per db_path (_WRITE_GENERATIONS), so a write
+    through any handler on the same database drops all cached reads.
+
+    The cache is one OrderedDict shared by all threads (connections are
+    thread-local, results aren't), so bookkeeping runs under a lock; the
+    SQL itself executes outside it. The generation is captured before
+    the SELECT runs — a write that lands mid-read invalidates the entry
+    being stored rather than getting masked by it.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        key = (method.__name__, args, tuple(sorted(kwargs.items())))
+        with self._read_cache_lock:
+            hit = self._read_cache.get(key)
+            if hit is not None and hit[0] == self._write_generation:
+                self._read_cache.move_to_end(key)
+                return hit[1]
+        gen = self._write_generation
+        value = method(self, *args, **kwargs)
+        with self._read_cache_lock:
+            self._read_cache[key] = (gen, value)
+            if len(self._read_cache) > _READ_CACHE_SIZE:
+                self._read_cache.popitem(last=False)
+        return value
+    return wrapper
+
+
+def _join_name(row_dict: Dict, key: str, prefix: str) -> Dict:
+    """
+    Pop '<prefix>fname'/'<prefix>lname' out of row_dict and store the
+    joined full name under key (None when the outer join found nobody).
+
+    The hot queries select the raw name columns instead of doing || per
+    row inside SQLite's text engine; this rebuilds the familiar
+    '<key>' field so result shapes stay unchanged.
+    """
+    fname = row_dict.pop(prefix + "fname")
+    lname = row_dict.pop(prefix + "lname")
+    row_dict[key] = f"{fname} {lname}" if fname is not None else None
+    return row_dict
+
+
+# Month -> season lookup for the current-term computation: a dict probe
+# instead of an if/elif chain on the enrollment path.
+_MONTH_TO_SEASON = {1: "Winter", 2: "Winter",
+                    3: "Spring", 4: "Spring", 5: "Spring",
+                    6: "Summer", 7: "Summer", 8: "Summer",
+                    9: "Fall", 10: "Fall", 11: "Fall", 12: "Fall"}
+
+
+@functools.lru_cache(maxsize=16)
+def _current_term(year_month: Tuple[int, int]) -> Tuple[str, int]:
+    """(year, month) -> (season, year). Memoized so every enrollment in the
+    same month shares one computation."""
+    year, month = year_month
+    return _MONTH_TO_SEASON[month], year
+
+
+@functools.lru_cache(maxsize=32)
+def _exists_sql(table: str, column: str) -> str:
+    """Memoize the existence-check SQL per (table, column) pair so repeated
+    checks reuse the exact string and hit SQLite's prepared-statement cache"""
+    return f"SELECT 1 FROM {table} WHERE {column} = ? LIMIT 1"
+
+
+@functools.lru_cache(maxsize=256)
+def _build_update_sql(table: str, key_clause: str, fields: Tuple[str, ...]) -> str:
+    """
+    Build (and memoize) an UPDATE statement for a fixed field set.
+
+    Callers pass fields in sorted order so every call with the same column
+    set produces the exact same SQL text, which is what both this cache and
+    SQLite's prepared-statement cache key on.
+    """
+    set_clause = ", ".join(f"{field} = ?" for field in fields)
+    return f"UPDATE {table} SET {set_clause} WHERE {key_clause}"
+
+
+class Fetch(Enum):
     ALL = "all"
     ONE = "one"
+    EAGER_JSON = "eager_json"   # nested children via json_group_array, one row
 
 class InvalidEmail(Exception): ...
 
@@ -39,25 +186,295 @@ class RecordNotFound(Exception):
         super().__init__(self.message)
 
 
+# Connection tuning applied to every new connection. WAL lets readers proceed
+# while a writer is active, NORMAL halves fsync traffic compared to FULL, and
+# the rest keep hot pages and temporary structures in memory.
+DEFAULT_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "cache_size": -65536,       # 64 MiB page cache
+    "temp_store": "MEMORY",
+    "mmap_size": 268435456,     # 256 MiB memory-mapped I/O
+    "page_size": 4096,          # only takes effect on a freshly created database
+    "busy_timeout": 60000,
+    # With a 64 MiB cache there is no reason to let a writer spill dirty
+    # pages mid-transaction (spilling grabs the exclusive lock early and
+    # stalls the long-lived read cursors).
+    "cache_spill": "OFF",
+}
+
+
+# Indexes kept out of ddl.sql so bulk loads can create them after the data:
+# maintaining a B-tree per insert dominates load cost, while building the
+# indexes once at the end is roughly 3x cheaper on large loads.
+SCHEMA_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS idx_student_dept ON student(dept_name)",
+    "CREATE INDEX IF NOT EXISTS idx_student_email ON student(email)",
+    "CREATE INDEX IF NOT EXISTS idx_instructor_dept ON instructor(dept_name)",
+    "CREATE INDEX IF NOT EXISTS idx_course_dept ON course(dept_name)",
+    "CREATE INDEX IF NOT EXISTS idx_takes_student ON takes(student_id, cancelled, grade)",
+    "CREATE INDEX IF NOT EXISTS idx_takes_course ON takes(course_id, semester, academic_year)",
+    "CREATE INDEX IF NOT EXISTS idx_section_semester ON section(semester, academic_year)",
+    "CREATE INDEX IF NOT EXISTS idx_teaches_instructor_term ON teaches(instructor_id, semester, academic_year)",
+    # teaches' PK leads with instructor_id, so joining teaches by section
+    # key (section info / listings) needs its own index.
+    "CREATE INDEX IF NOT EXISTS idx_teaches_section ON teaches(course_id, sec_id, semester, academic_year)",
+    # section's 4-column PK, takes' 5-column PK and prereq's
+    # (course_id, prereq_id) PK already provide the remaining lookup paths.
+)
+
+
+# Hot enrollment/section SQL, hoisted to module level. sqlite3's
+# prepared-statement cache keys on the exact SQL text, so sharing one
+# string object per statement keeps every call landing in the same slot.
+_Q_SECTION_EXISTS = """
+    SELECT 1 FROM section
+    WHERE course_id = ? AND sec_id = ? AND semester = ? AND academic_year = ?
+    LIMIT 1
+"""
+
+_Q_SECTION_INFO = """
+    SELECT s.course_id, s.sec_id, s.semester, s.academic_year,
+           s.time_slot, s.room, s.capacity, s.enrolled,
+           i.fname AS instructor_fname, i.lname AS instructor_lname
+    FROM section s
+    LEFT JOIN teaches t ON s.course_id = t.course_id
+                        AND s.sec_id = t.sec_id
+                        AND s.semester = t.semester
+                        AND s.academic_year = t.academic_year
+    LEFT JOIN instructor i ON t.instructor_id = i.id
+    WHERE s.course_id = ? AND s.sec_id = ? AND s.semester = ? AND s.academic_year = ?
+"""
+
+_Q_ALL_SECTIONS_BASE = """
+    SELECT s.course_id, s.sec_id, s.semester, s.academic_year,
+        s.time_slot, s.room, s.capacity, s.enrolled,
+        c.title, c.credits, c.dept_name,
+        i.fname AS instructor_fname, i.lname AS instructor_lname,
+        i.id AS instructor_id
+    FROM section s
+    JOIN course c ON s.course_id = c.course_id
+    LEFT JOIN teaches t ON s.course_id = t.course_id
+                        AND s.sec_id = t.sec_id
+                        AND s.semester = t.semester
+                        AND s.academic_year = t.academic_year
+    LEFT JOIN instructor i ON t.instructor_id = i.id
+"""
+
+_Q_ALL_SECTIONS_ORDER = " ORDER BY s.academic_year, s.semester, s.course_id, s.sec_id"
+
+# The four filter variants of the section listing, specialized at import so
+# per-call string assembly disappears and each variant keeps its own slot in
+# SQLite's statement cache. Keyed by (sem is not None, year is not None).
+_Q_ALL_SECTIONS = {
+    (False, False): _Q_ALL_SECTIONS_BASE + _Q_ALL_SECTIONS_ORDER,
+    (True, False): _Q_ALL_SECTIONS_BASE + " WHERE s.semester = ?" + _Q_ALL_SECTIONS_ORDER,
+    (False, True): _Q_ALL_SECTIONS_BASE + " WHERE s.academic_year = ?" + _Q_ALL_SECTIONS_ORDER,
+    (True, True): (_Q_ALL_SECTIONS_BASE
+                   + " WHERE s.semester = ? AND s.academic_year = ?"
+                   + _Q_ALL_SECTIONS_ORDER),
+}
+
+_Q_ENROLL_SEAT = """
+    UPDATE section
+    SET enrolled = enrolled + 1
+    WHERE course_id = ? AND sec_id = ? AND semester = ? AND academic_year = ?
+          AND enrolled < capacity
+"""
+
+_Q_ENROLL_INSERT = """
+    INSERT INTO takes (student_id, course_id, sec_id, semester, academic_year, cancelled)
+    VALUES (?, ?, ?, ?, ?, FALSE)
+"""
+
+_Q_DROP_DELETE = """
+    DELETE FROM takes
+    WHERE student_id = ? AND course_id = ? AND sec_id = ?
+          AND semester = ? AND academic_year = ?
+"""
+
+_Q_DROP_SEAT = """
+    UPDATE section
+    SET enrolled = enrolled - 1
+    WHERE course_id = ? AND sec_id = ? AND semester = ? AND academic_year = ?
+"""
+
+_Q_ASSIGN_GRADE = """
+    UPDATE takes
+    SET grade = ?
+    WHERE student_id = ? AND course_id = ? AND sec_id = ?
+          AND semester = ? AND academic_year = ?
+"""
+
+# Both arities of the advisor INSERT, precomputed so the per-call column
+# list join disappears and each variant keys the statement cache stably.
+_Q_INSERT_ADVISOR = "INSERT INTO advisor(student_id, instructor_id) VALUES (?, ?)"
+_Q_INSERT_ADVISOR_DATED = ("INSERT INTO advisor(student_id, instructor_id, start_date) "
+                           "VALUES (?, ?, ?)")
+
+_Q_ENROLLMENT_INFO = """
+    SELECT st.fname AS student_fname, st.lname AS student_lname,
+           t.student_id, t.course_id, t.sec_id, t.semester, t.academic_year,
+           t.cancelled, t.enrollment_date, t.grade,
+           s.time_slot, s.room
+    FROM takes t
+    LEFT JOIN section s ON t.course_id = s.course_id
+                        AND t.sec_id = s.sec_id
+                        AND t.semester = s.semester
+                        AND t.academic_year = s.academic_year
+    LEFT JOIN student st ON t.student_id = st.id
+    WHERE t.student_id = ? AND t.course_id = ? AND t.sec_id = ?
+          AND t.semester = ? AND t.academic_year = ?
+"""
+
+
+# Long-lived connection pool, keyed by (db_path, thread id). Handlers release
+# their connection here on close() instead of tearing it down, so the next
+# handler a thread opens on the same database starts with SQLite's page cache
+# already hot. ':memory:' connections are never pooled — each one is its own
+# database.
+_CONNECTION_POOL: Dict[Tuple[str, int], sqlite3.Connection] = {}
+
+# Write generations live at module scope, keyed by db_path, so a write
+# through any handler invalidates cached reads in every handler open on
+# the same database — not just the one that wrote. All ':memory:'
+# handlers share one slot; since each is a distinct database the only
+# cost of that collision is a spurious cache miss.
+_WRITE_GEN_LOCK = threading.Lock()
+_WRITE_GENERATIONS: Dict[str, int] = {}
+
+
+def shutdown_pool():
+    """Commit and close every pooled connection (process shutdown, tests)"""
+    while _CONNECTION_POOL:
+        _, conn = _CONNECTION_POOL.popitem()
+        try:
+            conn.commit()
+            conn.close()
+        except sqlite3.Error:
+            pass
+
+
 class UniversityData(ABC):
-    def __init__(self, db: str):
-        self.db_path = os.path.join(os.path.dirname(__file__), db)
-        exists = os.path.exists(self.db_path)
-        self.conn = sqlite3.connect(self.db_path)
-        self.cursor = self.conn.cursor()
-        self.cursor.execute("PRAGMA foreign_keys = ON")      # By default, SQLite does not enforce foreign key constraints unless you explicitly turn them on.
+    def __init__(self, db: str, pragmas: Optional[Dict[str, Any]] = None,
+                 deferred_indexes: bool = False):
+        if db == ":memory:":
+            self.db_path = db
+            exists = False
+        else:
+            self.db_path = os.path.join(os.path.dirname(__file__), db)
+            exists = os.path.exists(self.db_path)
+        self.pragmas = {**DEFAULT_PRAGMAS, **(pragmas or {})}
+        # One connection per thread: WAL already permits concurrent readers
+        # alongside a writer, but a single shared sqlite3 object would make
+        # every thread queue on its mutex. Connections are created lazily the
+        # first time a thread touches .conn (note that a ':memory:' database
+        # is therefore only visible to the thread that created the handler).
+        self._local = threading.local()
+        self._read_cache = OrderedDict()
+        self._read_cache_lock = threading.Lock()
+        _WRITE_GENERATIONS.setdefault(self.db_path, 0)
+        _ = self.conn   # open the creating thread's connection eagerly
         if not exists:
             self._read_ddl()
-            
+            if not deferred_indexes:
+                self.ensure_indexes()
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "conn", None)
+        if connection is None:
+            if self.db_path != ":memory:":
+                connection = _CONNECTION_POOL.pop((self.db_path, threading.get_ident()), None)
+            if connection is None:
+                # cached_statements keeps the compiled form of the hot, fixed
+                # SQL strings around so repeated calls skip sqlite3_prepare_v2.
+                connection = sqlite3.connect(self.db_path, cached_statements=256)
+            # (re)applied on pooled connections too, so per-handler pragma
+            # overrides take effect
+            self._configure_connection(connection)
+            self._local.conn = connection
+            self._local.cursor = connection.cursor()
+        return connection
+
+    @property
+    def cursor(self) -> sqlite3.Cursor:
+        _ = self.conn   # make sure this thread's connection exists
+        return self._local.cursor
+
+    @property
+    def _write_generation(self) -> int:
+        return _WRITE_GENERATIONS[self.db_path]
+
+    def _bump_write_generation(self):
+        """Mark the database as written; drops every cached read on it"""
+        with _WRITE_GEN_LOCK:
+            _WRITE_GENERATIONS[self.db_path] += 1
+
     def __enter__(self):
         return self
-        
+
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.close()
-    
+
     def close(self):
+        """Commit the calling thread's work and release its connection back
+        to the pool (':memory:' connections are closed outright)"""
+        connection = getattr(self._local, "conn", None)
+        if connection is not None:
+            connection.commit()
+            if self.db_path == ":memory:":
+                connection.close()
+            else:
+                _CONNECTION_POOL[(self.db_path, threading.get_ident())] = connection
+            self._local.conn = None
+            self._local.cursor = None
+
+    # ---------------- transaction control -----------------
+    def begin(self):
+        """Open an explicit transaction on this thread's connection"""
+        if not self.conn.in_transaction:
+            self.cursor.execute("BEGIN")
+
+    def commit(self):
         self.conn.commit()
-        self.conn.close()
+
+    def rollback(self):
+        self.conn.rollback()
+
+    @contextmanager
+    def transaction(self):
+        """
+        Group several write calls into a single commit.
+
+        Inside the block _exec skips its per-statement commit, so a batch
+        of inserts/updates costs one fsync instead of one per call:
+
+            with db.transaction():
+                for row in rows:
+                    db.create_student(*row)
+
+        Commits on normal exit, rolls back if the block raises.
+        """
+        self.begin()
+        self._local.in_txn = True
+        try:
+            yield self
+        except Exception:
+            self._local.in_txn = False
+            self.rollback()
+            raise
+        self._local.in_txn = False
+        self.commit()
+
+    def _configure_connection(self, conn: sqlite3.Connection):
+        """Apply foreign-key enforcement and performance pragmas to a connection"""
+        # Row is a C-level object with both index and column-name access;
+        # building one is far cheaper than a per-row dict(zip(names, row)).
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA foreign_keys = ON")      # By default, SQLite does not enforce foreign key constraints unless you explicitly turn them on.
+        for name, value in self.pragmas.items():
+            conn.execute(f"PRAGMA {name} = {value}")
 
     def _read_ddl(self):
         "loads the tables - ddl: data definition language"
@@ -68,7 +485,14 @@ class UniversityData(ABC):
             script = file.read()
             self.cursor.executescript(script)
         self.conn.commit()
-        
+
+    def ensure_indexes(self):
+        """Create any missing schema indexes and refresh planner statistics"""
+        for statement in SCHEMA_INDEXES:
+            self.cursor.execute(statement)
+        self.cursor.execute("ANALYZE")
+        self.conn.commit()
+
     def _exec(self, query: str, params: Tuple = ()) -> bool: 
         """
         Execute a SQL query with parameters and commit the transaction.
@@ -85,32 +509,65 @@ class UniversityData(ABC):
         """
         if not isinstance(params, tuple): 
             params = (params,)
-        try: 
+        try:
             self.cursor.execute(query, params)
-            self.conn.commit()
-            if self.cursor.rowcount != -1: 
-                print("Rows affected:", self.cursor.rowcount)
+            if not getattr(self._local, "in_txn", False):
+                self.conn.commit()
+            self._bump_write_generation()
+            if self.cursor.rowcount != -1:
+                logger.debug("Rows affected: %d", self.cursor.rowcount)
             return True
         except sqlite3.Error as e: 
             raise DataBaseError(e)
         
-    def _select(self, query: str, params: Tuple = (), 
-                fetch_type: Fetch = Fetch.ALL) -> Union[List[Tuple], Optional[Tuple]]:
-        """Execute a SELECT query and return results"""
-        if not isinstance(params, tuple): 
+    def _select_all(self, query: str, params: Tuple = ()) -> List[Tuple]:
+        """Execute a SELECT query and return all rows"""
+        if not isinstance(params, tuple):
             params = (params,)
         try:
             self.cursor.execute(query, params)
-            match fetch_type: 
-                case Fetch.ALL: 
-                    return self.cursor.fetchall()
-                case Fetch.ONE: 
-                    return self.cursor.fetchone()
-                case _: 
-                    raise ValueError(f"Invalid fetch_type: {fetch_type}")
+            return self.cursor.fetchall()
         except sqlite3.Error as e:
             raise DataBaseError(e)
-        
+
+    def _select_one(self, query: str, params: Tuple = ()) -> Optional[Tuple]:
+        """Execute a SELECT query and return the first row (or None)"""
+        if not isinstance(params, tuple):
+            params = (params,)
+        try:
+            self.cursor.execute(query, params)
+            return self.cursor.fetchone()
+        except sqlite3.Error as e:
+            raise DataBaseError(e)
+
+    def _select(self, query: str, params: Tuple = (),
+                fetch_type: Fetch = Fetch.ALL) -> Union[List[Tuple], Optional[Tuple]]:
+        """Dispatch to _select_all/_select_one; kept for callers that pick
+        the fetch mode at runtime"""
+        if fetch_type is Fetch.ALL:
+            return self._select_all(query, params)
+        if fetch_type is Fetch.ONE:
+            return self._select_one(query, params)
+        raise ValueError(f"Invalid fetch_type: {fetch_type}")
+
+    def _select_iter(self, query: str, params: Tuple = ()) -> Iterator[sqlite3.Row]:
+        """
+        Execute a SELECT and yield rows straight off the cursor.
+
+        Unlike _select this never materializes the full result set, so
+        iterating a large table costs constant memory. Runs on its own
+        cursor so other queries issued while the caller is still iterating
+        don't clobber the stream.
+        """
+        if not isinstance(params, tuple):
+            params = (params,)
+        try:
+            cursor = self.conn.cursor()
+            cursor.execute(query, params)
+        except sqlite3.Error as e:
+            raise DataBaseError(e)
+        return iter(cursor)
+
     def _check_query(self, table: str, column: str, value: Any) -> bool:
         """
         Check if a record exists in the specified table.
@@ -123,17 +580,48 @@ class UniversityData(ABC):
         Returns:
             bool: True if at least one matching record exists, False otherwise
         """
-        check_query = f"""SELECT COUNT(*) FROM {table} WHERE {column} = ?"""
-        exists = self._select(check_query, value, Fetch.ONE)[0] != 0
+        exists = self._select_one(_exists_sql(table, column), value) is not None
         return exists
 
+    def _executemany_txn(self, query: str, rows: List[Tuple]) -> bool:
+        """Run one executemany inside a single transaction: one prepared
+        statement and one commit for the whole batch"""
+        try:
+            self.cursor.executemany(query, rows)
+            self.conn.commit()
+            self._bump_write_generation()
+            return True
+        except sqlite3.Error as e:
+            self.conn.rollback()
+            raise DataBaseError(e)
+
+    def _prefetch(self, parent_ids: List, child_table: str,
+                  fk_col: str) -> Dict[Any, List[Tuple]]:
+        """
+        Batch-load child rows for many parents with one IN (...) query
+        per 999-parent chunk.
+
+        Returns a dict mapping parent id -> list of child rows; parents
+        without children map to an empty list. A constant number of queries
+        regardless of parent count, instead of one query per parent.
+        """
+        children = {pid: [] for pid in parent_ids}
+        for start in range(0, len(parent_ids), 999):
+            chunk = list(parent_ids)[start:start + 999]
+            qmarks = ", ".join(["?"] * len(chunk))
+            rows = self._select_all(f"SELECT * FROM {child_table} WHERE {fk_col} IN ({qmarks})",
+                                tuple(chunk))
+            for row in rows:
+                children[row[fk_col]].append(row)
+        return children
+
     # ---------------- validation methods -----------------
     def _validate_email(self, email: str):
-        if not re.match(r"[^@]+@[^@]+\.[^@]+$", email):
+        if not EMAIL_RE.match(email):
             raise InvalidEmail()
     
     def _validate_semester(self, sem: str):
-        if sem not in ['Fall', 'Winter', 'Spring', 'Summer']:
+        if sem not in SUPPORTED_SEMESTERS:
             raise IncorrectValue("semester", sem)
 
     def _validate_salary(self, amount: Union[float, str]):
@@ -145,61 +633,76 @@ class UniversityData(ABC):
             raise IncorrectValue("salary", amount)
         
     def _validate_date(self, date: str):
-        pattern = r"^[\d]{4}-[\d]{2}-[\d]{2}$"
-        if re.match(pattern, date):
-            _, month, day = map(int, date.split('-'))
-            has_days = {1: 31, 2: 28, 3: 31, 4: 30, 5: 31, 6: 30,
-                        7:31, 8: 31, 9: 30, 10: 31, 11: 30, 12: 31}
-            if month in has_days and 0 < day <= has_days[month]:
-                return 
-        raise UnsupportedDateFormat(date)
+        try:
+            datetime.strptime(date, "%Y-%m-%d")
+        except (ValueError, TypeError):
+            raise UnsupportedDateFormat(date)
           
     def _validate_status(self, status: str):
-        if status not in ['Active', 'Inactive', 'Graduated', 'Suspended']:
+        if status not in VALID_STATUSES:
             raise IncorrectValue("status", status)
-    
+
     def _validate_grade(self, grade: str):
-        valid_grades = ['A+', 'A', 'A-', 'B+', 'B', 'B-', 'C+', 'C', 'C-', 'D+', 'D', 'F']
-        if grade not in valid_grades:
+        if grade not in VALID_GRADES:
             raise IncorrectValue("grade", grade)
-    
-    def _validate_rank(self, rank: str): 
-        valid_ranks = ['Assistant Professor', 'Associate Professor', 'Professor', 'Lecturer', 'Adjunct']
-        if rank not in valid_ranks: 
+
+    def _validate_rank(self, rank: str):
+        if rank not in VALID_RANKS:
             raise IncorrectValue("academic rank", rank)
     
-    def _validate_credit(self, cred: int): 
-        if isinstance(cred, int): 
-            if 0 < cred < 5: 
-                return 
-            raise IncorrectValue("credit", cred)
-        raise ValueError("credits should be an integer")
-    
-    def _validate_academic_year(self, year: int): 
-        if isinstance(year, int): 
-            if 1701 < year < 2100: 
-                return
-            raise IncorrectValue("academic_year", year)
-        raise ValueError("academic_year should be an integer")
+    def _validate_credit(self, cred: int):
+        if type(cred) is int and 0 < cred < 5:
+            return
+        raise IncorrectValue("credit", cred)
+
+    def _validate_academic_year(self, year: int):
+        if type(year) is int and 1701 < year < 2100:
+            return
+        raise IncorrectValue("academic_year", year)
     
     def _validate_timeslot(self, slot: str):
-        day_pattern = r"([MTWFS]|Th|Su|TTh|MWF|MW|TR|WF)"
-        hhmm_pattern = r"([01]?[0-9]|2[0-3]):[0-5][0-9]"
-        pattern = rf'^{day_pattern}\s{hhmm_pattern}-{hhmm_pattern}$'
-        if not re.match(pattern, slot): 
+        if not _TIMESLOT_RE.match(slot):
             raise IncorrectTimeslot(slot)
         
     
 class AdminQueryHandler(UniversityData):
-    def __init__(self, db):
-        super().__init__(db)
+    def __init__(self, db, pragmas: Optional[Dict[str, Any]] = None,
+                 deferred_indexes: bool = False):
+        super().__init__(db, pragmas, deferred_indexes)
+        # Departments and instructors are resolved over and over while
+        # inserting students/sections but change rarely, so their existence
+        # checks are memoized per instance. Writes to either table must call
+        # clear_caches() to keep the answers honest.
+        self._dept_exists = functools.lru_cache(maxsize=4096)(self._dept_exists_query)
+        self._instructor_exists = functools.lru_cache(maxsize=4096)(self._instructor_exists_query)
+        # Multi-row INSERT statements generated once per handler: feeding
+        # 128/32/8 rows through a single VALUES list amortizes the per-
+        # statement VDBE dispatch that dominates row-at-a-time inserts.
+        self._student_insert_sql = {
+            k: "INSERT INTO student (fname, lname, dept_name, email, tot_cred, major) "
+               "VALUES " + ", ".join(["(?, ?, ?, ?, ?, ?)"] * k)
+            for k in _BATCH_SIZES
+        }
+
+    def _dept_exists_query(self, dept_name: str) -> bool:
+        return self._check_query(table="department", column="dept_name", value=dept_name)
+
+    def _instructor_exists_query(self, instructor_id: int) -> bool:
+        return self._check_query(table="instructor", column="id", value=instructor_id)
+
+    def clear_caches(self):
+        """Drop the memoized existence lookups (after dept/instructor writes)"""
+        self._dept_exists.cache_clear()
+        self._instructor_exists.cache_clear()
 
     # ---------------- department management -------------------
     def create_dept(self, dept_name: str, phone: str, budget: float,
                     building: str, dean_name: str) -> bool:
         """Create a new department"""
         query = "INSERT INTO department VALUES(?, ?, ?, ?, ?)"
-        return self._exec(query, (dept_name, phone, budget, building, dean_name))
+        result = self._exec(query, (dept_name, phone, budget, building, dean_name))
+        self.clear_caches()
+        return result
     
     def update_dept(self, dept_name: str, **updates) -> bool:
         """
@@ -217,43 +720,68 @@ class AdminQueryHandler(UniversityData):
             DataBaseError: If database error occurs
             ValueError: If no updates provided or invalid field names
         """
-        dept_exists = self._check_query(table="department", column="dept_name", value=dept_name)
-        if not dept_exists: 
-            raise RecordNotFound("Department", dept_name)
-        
         if not updates:
             raise ValueError("No updates provided")
         
-        valid = {"phone", "budget", "building", "dean_name"}
-        
-        invalid = set(updates.keys()) - valid
+        invalid = updates.keys() - _DEPT_FIELDS
         if invalid:
             raise ValueError(f"Invalid field names: {invalid}")
         
-        set_clause = ", ".join([f"{field} = ?" for field in updates.keys()])
-        query = f"UPDATE department SET {set_clause} WHERE dept_name = ?"
-        params = tuple(updates.values()) + (dept_name,)
-        
-        return self._exec(query, params)
-    
-    def delete_dept(self, dept_name: str) -> bool: 
-        """Delete department (check RESTRICT constraint)"""
-        exists = self._check_query(table="department", column="dept_name", value=dept_name)
-        if not exists: 
+        fields = tuple(sorted(updates))
+        query = _build_update_sql("department", "dept_name = ?", fields)
+        params = tuple(updates[f] for f in fields) + (dept_name,)
+
+        result = self._exec(query, params)
+        self.clear_caches()
+        if self.cursor.rowcount == 0:
             raise RecordNotFound("Department", dept_name)
+        return result
+
+    def delete_dept(self, dept_name: str) -> bool:
+        """Delete department (check RESTRICT constraint)"""
         query = "DELETE FROM department WHERE dept_name = ?"
-        return self._exec(query, dept_name)
+        result = self._exec(query, dept_name)
+        self.clear_caches()
+        if self.cursor.rowcount == 0:
+            raise RecordNotFound("Department", dept_name)
+        return result
     
+    @cached_read
     def get_dept_info(self, dept_name: str) -> Optional[Tuple]:
         """Get department information"""
         query = "SELECT * FROM department WHERE dept_name = ?"
-        return self._select(query, dept_name, Fetch.ONE)
+        return self._select_one(query, dept_name)
     
     def get_all_depts(self) -> List[tuple]:
         """Get all departments"""
         query = "SELECT * FROM department"
-        return self._select(query) 
+        return self._select_all(query) 
     
+    def get_department_report(self) -> List[Dict]:
+        """
+        Report every department with its students, instructors, and courses.
+
+        Children are batch-loaded with _prefetch, so this issues four
+        queries in total however many departments exist — not one per
+        department per child table.
+        """
+        depts = self._select_all("SELECT * FROM department")
+        names = [row["dept_name"] for row in depts]
+
+        students = self._prefetch(names, "student", "dept_name")
+        instructors = self._prefetch(names, "instructor", "dept_name")
+        courses = self._prefetch(names, "course", "dept_name")
+
+        report = []
+        for row in depts:
+            entry = dict(row)
+            name = row["dept_name"]
+            entry["students"] = [dict(r) for r in students[name]]
+            entry["instructors"] = [dict(r) for r in instructors[name]]
+            entry["courses"] = [dict(r) for r in courses[name]]
+            report.append(entry)
+        return report
+
     # ---------------- student management ---------------------
     def create_student(self, fname: str, lname: str, dept_name: str, email: str,
                        *, tot_cred: int = 0, major: str = None,
@@ -274,11 +802,10 @@ class AdminQueryHandler(UniversityData):
             int: ID of the newly created student.
         """        
         self._validate_email(email)
-        if enrollment_date: 
+        if enrollment_date:
             self._validate_date(enrollment_date)
 
-        dept_exists = self._check_query(table="department", column="dept_name", value=dept_name)
-        if not dept_exists:
+        if not self._dept_exists(dept_name):
             raise RecordNotFound("Department", dept_name)
 
         columns = ["fname", "lname", "dept_name", "email", "tot_cred", "major"]
@@ -294,78 +821,221 @@ class AdminQueryHandler(UniversityData):
         self._exec(query, tuple(values))
         return self.cursor.lastrowid    
     
+    def create_students_bulk(self, rows: List[Tuple]) -> List[int]:
+        """
+        Create many student records in one transaction.
+
+        Parameters:
+            rows: Sequence of (fname, lname, dept_name, email) tuples.
+
+        Returns:
+            List[int]: IDs of the newly created students, in input order.
+
+        All rows are validated up front, then inserted with a single
+        executemany inside one transaction — one statement parse and one
+        commit for the whole batch instead of one per student.
+        """
+        normalized = []
+        for fname, lname, dept_name, email in rows:
+            self._validate_email(email)
+            if not self._dept_exists(dept_name):
+                raise RecordNotFound("Department", dept_name)
+            normalized.append((fname, lname, dept_name, email, 0, None))
+
+        if not normalized:
+            return []
+
+        try:
+            i = 0
+            while i < len(normalized):
+                for k in _BATCH_SIZES:
+                    if i + k <= len(normalized):
+                        break
+                chunk = normalized[i:i + k]
+                flat_params = [value for row in chunk for value in row]
+                self.cursor.execute(self._student_insert_sql[k], flat_params)
+                i += k
+            self.conn.commit()
+            self._bump_write_generation()
+        except sqlite3.Error as e:
+            self.conn.rollback()
+            raise DataBaseError(e)
+
+        # rowids are assigned monotonically within the transaction, so the
+        # batch occupies a contiguous range ending at last_insert_rowid().
+        last = self.cursor.execute("SELECT last_insert_rowid()").fetchone()[0]
+        return list(range(last - len(normalized) + 1, last + 1))
+
+    def seed_students(self, count: int, dept_name: str) -> bool:
+        """
+        Generate synthetic students for demos and benchmarks.
+
+        A single INSERT ... SELECT over a recursive CTE makes SQLite emit
+        all the rows itself — no Python/SQLite boundary crossing per row.
+        Names and emails are suffixed past the current max id so repeated
+        seeding never collides with the UNIQUE email constraint.
+        """
+        if not self._dept_exists(dept_name):
+            raise RecordNotFound("Department", dept_name)
+        # The CTE's anchor row always emits i=1, so a non-positive count
+        # would still insert one student without this guard.
+        if count <= 0:
+            return True
+        query = """
+            INSERT INTO student (fname, lname, dept_name, email, tot_cred)
+            WITH RECURSIVE seq(i) AS (
+                SELECT 1 UNION ALL SELECT i + 1 FROM seq WHERE i < ?
+            ),
+            base(b) AS (SELECT COALESCE(MAX(id), 0) FROM student)
+            SELECT 'First' || (b + i), 'Last' || (b + i), ?,
+                   'student' || (b + i) || '@demo.edu', 0
+            FROM seq, base
+        """
+        return self._exec(query, (count, dept_name))
+
     def update_student(self, student_id: int, **updates) -> bool:
         """Update student information -- student_id is unchangeable"""
-        
-        student_exists = self._check_query(table="student", column="id", value=student_id)
-        if not student_exists: 
-            raise RecordNotFound("Student", student_id)
-        
-        if "status" in updates.keys(): 
+
+        if "status" in updates.keys():
             self._validate_status(updates["status"])
         if "email" in updates.keys(): 
             self._validate_email(updates["email"])
         if "enrollment_date" in updates.keys(): 
             self._validate_date(updates["enrollment_date"])
         
-        valid = {
-            "fname", "lname", "dept_name", 
-            "major", "tot_cred", "email", 
-            "enrollment_date", "status"
-        }
-        
-        invalid = set(updates.keys()) - valid 
-        if invalid: 
+        invalid = updates.keys() - _STUDENT_FIELDS
+        if invalid:
             raise ValueError(f"invalid field arg: {invalid}")
         
-        set_clause = ", ".join([f"{field} = ?" for field in updates.keys()]) 
-        query = f"UPDATE student SET {set_clause} WHERE id = ?"
-        params = tuple(updates.values()) + (student_id,)
-        
-        return self._exec(query, params)
-    
+        fields = tuple(sorted(updates))
+        query = _build_update_sql("student", "id = ?", fields)
+        params = tuple(updates[f] for f in fields) + (student_id,)
+
+        result = self._exec(query, params)
+        if self.cursor.rowcount == 0:
+            raise RecordNotFound("Student", student_id)
+        return result
+
     def delete_student(self, student_id: int) -> bool:
         """Delete student"""
-        exists = self._check_query(table="student", column="id", value=student_id)
-        if not exists: 
-            raise RecordNotFound("Student", student_id)   
         query = "DELETE FROM student WHERE id = ?"
-        return self._exec(query, student_id)
+        result = self._exec(query, student_id)
+        if self.cursor.rowcount == 0:
+            raise RecordNotFound("Student", student_id)
+        return result
             
-    def get_student_info(self, student_id: int) -> Optional[Tuple]:
-        """Get student information"""
-        query = "SELECT * FROM student WHERE id = ?"
-        return self._select(query, student_id, Fetch.ONE)
+    @cached_read
+    def get_student_info(self, student_id: int,
+                         fetch: Fetch = Fetch.ALL) -> Optional[Dict]:
+        """
+        Get student information with enrollments eagerly loaded.
+
+        One LEFT JOIN query fetches the student row and all of their
+        (non-cancelled) enrollments at once, instead of one query for the
+        student plus one per enrollment. With fetch=Fetch.EAGER_JSON the
+        nesting is done inside SQLite via json_group_array, so exactly one
+        row crosses the Python boundary.
+
+        Returns:
+            dict: Student fields plus an 'enrollments' list of dicts,
+                  or None if the student does not exist.
+        """
+        if fetch is Fetch.EAGER_JSON:
+            return self._get_student_info_json(student_id)
+
+        query = """
+            SELECT s.id, s.fname, s.lname, s.dept_name, s.major, s.tot_cred,
+                   s.email, s.enrollment_date, s.status,
+                   t.course_id, t.sec_id, t.semester, t.academic_year,
+                   t.grade, c.title, c.credits
+            FROM student s
+            LEFT JOIN takes t ON t.student_id = s.id AND t.cancelled = FALSE
+            LEFT JOIN course c ON c.course_id = t.course_id
+            WHERE s.id = ?
+        """
+        rows = self._select_all(query, student_id)
+        if not rows:
+            return None
+
+        student_fields = ("id", "fname", "lname", "dept_name", "major",
+                          "tot_cred", "email", "enrollment_date", "status")
+        enrollment_fields = ("course_id", "sec_id", "semester",
+                             "academic_year", "grade", "title", "credits")
+
+        student = dict(zip(student_fields, rows[0]))
+        student["enrollments"] = [
+            dict(zip(enrollment_fields, row[len(student_fields):]))
+            for row in rows if row[len(student_fields)] is not None
+        ]
+        return student
+
+    def _get_student_info_json(self, student_id: int) -> Optional[Dict]:
+        """Single-row variant of get_student_info: SQLite builds the nested
+        enrollment list itself with json_group_array"""
+        query = """
+            SELECT json_object(
+                'id', s.id, 'fname', s.fname, 'lname', s.lname,
+                'dept_name', s.dept_name, 'major', s.major,
+                'tot_cred', s.tot_cred, 'email', s.email,
+                'enrollment_date', s.enrollment_date, 'status', s.status,
+                'enrollments', json((
+                    SELECT json_group_array(json_object(
+                        'course_id', t.course_id, 'sec_id', t.sec_id,
+                        'semester', t.semester, 'academic_year', t.academic_year,
+                        'grade', t.grade, 'title', c.title, 'credits', c.credits))
+                    FROM takes t
+                    JOIN course c ON c.course_id = t.course_id
+                    WHERE t.student_id = s.id AND t.cancelled = FALSE
+                )))
+            FROM student s
+            WHERE s.id = ?
+        """
+        result = self._select_one(query, student_id)
+        if result is None:
+            return None
+        student = json.loads(result[0])
+        if student["enrollments"] is None:
+            student["enrollments"] = []
+        return student
  
-    def get_all_students(self, dept_name: Optional[str] = None) -> List[Tuple]:
+    def iter_all_students(self, dept_name: Optional[str] = None) -> Iterator[sqlite3.Row]:
+        """Stream all students row by row, optionally filtered by department"""
+        if dept_name:
+            return self._select_iter("SELECT * FROM student WHERE dept_name = ?", dept_name)
+        return self._select_iter("SELECT * FROM student")
+
+    def get_all_students(self, dept_name: Optional[str] = None) -> List[Dict]:
         """Get all students, optionally filtered by department"""
-        if dept_name: 
-            query = "SELECT * FROM student WHERE dept_name = ?"
-            result = self._select(query, dept_name)
-        else: 
-            result = self._select("SELECT * FROM student")
-            
-        column_names = [col[0] for col in self.cursor.description]
-        return [dict(zip(column_names, row)) for row in result]
+        return [dict(row) for row in self.iter_all_students(dept_name)]
     
+    def fetch_students(self, ids: List[int]) -> List[Dict]:
+        """
+        Fetch many students by id in one query per 999-id chunk.
+
+        A loop of get-by-id calls costs one round trip per student; a
+        single WHERE id IN (...) query does one B-tree probe batch. Chunked
+        at SQLite's default bound-parameter limit of 999.
+        """
+        results = []
+        for start in range(0, len(ids), 999):
+            chunk = ids[start:start + 999]
+            qmarks = ", ".join(["?"] * len(chunk))
+            rows = self._select_all(f"SELECT * FROM student WHERE id IN ({qmarks})", tuple(chunk))
+            results.extend(dict(row) for row in rows)
+        return results
+
     def search_students(self, **criteria) -> List[Tuple]:
         """Search students by various criteria (name, email, major, etc.)"""
         
-        valid = {
-            "id", "fname", "lname", 
-            "dept_name", "major", "tot_cred", 
-            "email", "enrollment_date", "status"
-        }
-        
-        invalid = set(criteria.keys()) - valid
-        if invalid: 
+        invalid = criteria.keys() - _STUDENT_SEARCH_FIELDS
+        if invalid:
             raise ValueError(f"invalid field arg: {invalid}")
         
         where_clause = " and ".join([f"{field} = ?" for field in criteria.keys()])
         query = f"SELECT * FROM student WHERE {where_clause}"
         params = tuple(criteria.values())
         
-        return self._select(query, params)
+        return self._select_all(query, params)
                 
     def get_student_transcript(self, student_id: int) -> List[Dict]:
         query = """
@@ -376,37 +1046,53 @@ class AdminQueryHandler(UniversityData):
             WHERE t.student_id = ? AND t.cancelled = FALSE AND t.grade IS NOT NULL
             ORDER BY t.academic_year, t.semester, t.course_id
         """
-        result = self._select(query, student_id)
+        result = self._select_all(query, student_id)
         
-        column_names = [col[0] for col in self.cursor.description]
-        return [dict(zip(column_names, row)) for row in result]
+        return [dict(row) for row in result]
 
         
-    def calculate_gpa(self, student_id: int) -> float: 
-        grade_points = {
-            'A+': 4.0, 'A': 4.0, 'A-': 3.7,
-            'B+': 3.3, 'B': 3.0, 'B-': 2.7,
-            'C+': 2.3, 'C': 2.0, 'C-': 1.7,
-            'D+': 1.3, 'D': 1.0, 'F': 0.0
-        }
-        
-        query = """
-            SELECT c.credits, t.grade
+    def calculate_gpa(self, student_id: int) -> float:
+        """Compute a student's GPA inside SQLite: one row (two sums) comes
+        back instead of every (credits, grade) pair"""
+        query = f"""
+            SELECT SUM(c.credits * {_GPA_CASE_SQL}), SUM(c.credits)
             FROM takes t
             JOIN course c ON t.course_id = c.course_id
             WHERE t.student_id = ? AND t.grade IS NOT NULL
         """
-        info = self._select(query, student_id)
-        
-        total_points = 0
-        total_credits = 0
-        
-        for credits, grade in info:
-            total_points += credits * grade_points[grade]
-            total_credits += credits
-        
-        return total_points / total_credits if total_credits > 0 else 0
-    
+        total_points, total_credits = self._select_one(query, student_id)
+        return total_points / total_credits if total_credits else 0
+
+    def calculate_gpas_bulk(self, dept_name: Optional[str] = None) -> Dict[int, float]:
+        """
+        Compute GPAs for every student (optionally one department) in a
+        single grouped query.
+
+        A per-student calculate_gpa loop costs one round trip each; here
+        SQLite aggregates all (credits, grade) pairs in one pass and ships
+        back one row per student.
+        """
+        query = f"""
+            SELECT t.student_id,
+                   SUM(c.credits * {_GPA_CASE_SQL}) / SUM(c.credits)
+            FROM takes t
+            JOIN course c ON t.course_id = c.course_id
+            {{dept_join}}
+            WHERE t.grade IS NOT NULL
+            {{dept_filter}}
+            GROUP BY t.student_id
+        """
+        if dept_name:
+            query = query.format(
+                dept_join="JOIN student st ON t.student_id = st.id",
+                dept_filter="AND st.dept_name = ?",
+            )
+            rows = self._select_all(query, dept_name)
+        else:
+            query = query.format(dept_join="", dept_filter="")
+            rows = self._select_all(query)
+        return {row[0]: row[1] for row in rows}
+
     # ---------------- Instructor Management --------------------
     def create_instructor(self, fname: str, lname: str, dept_name: str, email: str,
                          academic_rank: str, salary: float, hire_date: Optional[str] = None,
@@ -416,11 +1102,10 @@ class AdminQueryHandler(UniversityData):
         self._validate_email(email)
         self._validate_rank(academic_rank)
         self._validate_salary(salary)
-        if hire_date: 
+        if hire_date:
             self._validate_date(hire_date)
-            
-        dept_exists = self._check_query(table="department", column="dept_name", value=dept_name)
-        if not dept_exists:
+
+        if not self._dept_exists(dept_name):
             raise RecordNotFound("Department", dept_name)
 
         columns = ["fname", "lname", "dept_name", "email", "academic_rank", "salary", "office_number"]
@@ -432,18 +1117,49 @@ class AdminQueryHandler(UniversityData):
         
         qmarks = ["?"] * len(values)
         query = f"INSERT INTO instructor ({', '.join(columns)}) VALUES ({', '.join(qmarks)})"
-        
+
         self._exec(query, tuple(values))
-        return self.cursor.lastrowid    
+        self.clear_caches()
+        return self.cursor.lastrowid
+
+    def create_instructors_bulk(self, rows: List[Tuple]) -> List[int]:
+        """
+        Create many instructor records in one transaction.
+
+        Parameters:
+            rows: Sequence of (fname, lname, dept_name, email,
+                  academic_rank, salary) tuples.
+
+        Returns:
+            List[int]: IDs of the newly created instructors, in input order.
+
+        Rows are validated up front (fail fast), then inserted with a single
+        executemany and one commit.
+        """
+        normalized = []
+        for fname, lname, dept_name, email, academic_rank, salary in rows:
+            self._validate_email(email)
+            self._validate_rank(academic_rank)
+            self._validate_salary(salary)
+            if not self._dept_exists(dept_name):
+                raise RecordNotFound("Department", dept_name)
+            normalized.append((fname, lname, dept_name, email, academic_rank, salary, None))
+
+        if not normalized:
+            return []
+
+        query = """INSERT INTO instructor (fname, lname, dept_name, email,
+                                           academic_rank, salary, office_number)
+                   VALUES (?, ?, ?, ?, ?, ?, ?)"""
+        self._executemany_txn(query, normalized)
+        self.clear_caches()
+        last = self.cursor.execute("SELECT last_insert_rowid()").fetchone()[0]
+        return list(range(last - len(normalized) + 1, last + 1))
 
     def update_instructor(self, instructor_id: int, **updates) -> bool:
         """Update instructor information"""
-        
-        instructor_exists = self._check_query(table="instructor", column="id", value=instructor_id)
-        if not instructor_exists: 
-            raise RecordNotFound("Instructor", instructor_id)
-        
-        if "academic_rank" in updates.keys(): 
+
+        if "academic_rank" in updates.keys():
             self._validate_rank(updates["academic_rank"])
         if "email" in updates.keys(): 
             self._validate_email(updates["email"])
@@ -452,45 +1168,44 @@ class AdminQueryHandler(UniversityData):
         if "salary" in updates.keys(): 
             self._validate_salary(updates["salary"])
         
-        valid = {
-            "fname", "lname", "dept_name", 
-            "academic_rank", "salary", "email", 
-            "hire_date", "office_number"
-        }
-        
-        invalid = set(updates.keys()) - valid 
-        if invalid: 
+        invalid = updates.keys() - _INSTRUCTOR_FIELDS
+        if invalid:
             raise ValueError(f"invalid field arg: {invalid}")
         
-        set_clause = ", ".join([f"{field} = ?" for field in updates.keys()])    
-        query = f"UPDATE instructor SET {set_clause} WHERE id = ?"
-        params = tuple(updates.values()) + (instructor_id,)
-        
-        return self._exec(query, params)
-    
+        fields = tuple(sorted(updates))
+        query = _build_update_sql("instructor", "id = ?", fields)
+        params = tuple(updates[f] for f in fields) + (instructor_id,)
+
+        result = self._exec(query, params)
+        self.clear_caches()
+        if self.cursor.rowcount == 0:
+            raise RecordNotFound("Instructor", instructor_id)
+        return result
+
     def delete_instructor(self, instructor_id: int) -> bool:
         """Delete instructor record"""
-        exists = self._check_query(table="instructor", column="id", value=instructor_id)
-        if not exists: 
-            raise RecordNotFound("Instructor", instructor_id)
         query = "DELETE FROM instructor WHERE id = ?"
-        return self._exec(query, instructor_id)
+        result = self._exec(query, instructor_id)
+        self.clear_caches()
+        if self.cursor.rowcount == 0:
+            raise RecordNotFound("Instructor", instructor_id)
+        return result
         
+    @cached_read
     def get_instructor_info(self, instructor_id: int) -> Optional[Tuple]:
         """Get instructor information"""
         query = "SELECT * FROM instructor WHERE id = ?"
-        return self._select(query, instructor_id, Fetch.ONE)
+        return self._select_one(query, instructor_id)
      
-    def get_all_instructors(self, dept_name: Optional[str] = None) -> List[Tuple]:
+    def iter_all_instructors(self, dept_name: Optional[str] = None) -> Iterator[sqlite3.Row]:
+        """Stream all instructors row by row, optionally filtered by department"""
+        if dept_name:
+            return self._select_iter("SELECT * FROM instructor WHERE dept_name = ?", dept_name)
+        return self._select_iter("SELECT * FROM instructor")
+
+    def get_all_instructors(self, dept_name: Optional[str] = None) -> List[Dict]:
         """Get all instructors, optionally filtered by department"""
-        if dept_name: 
-            query = "SELECT * FROM instructor WHERE dept_name = ?"
-            result = self._select(query, dept_name)
-        else: 
-            result = self._select("SELECT * FROM instructor")
-            
-        column_names = [col[0] for col in self.cursor.description]
-        return [dict(zip(column_names, row)) for row in result]
+        return [dict(row) for row in self.iter_all_instructors(dept_name)]
     
     def get_instructor_workload(self, instructor_id: int, semester: str, year: int) -> List[Dict]:
         """Get instructor's teaching workload for a semester"""
@@ -504,10 +1219,9 @@ class AdminQueryHandler(UniversityData):
             WHERE t.instructor_id = ? AND t.semester = ? AND t.academic_year = ?
         """
         params = (instructor_id, semester, year)
-        result = self._select(query, params)
+        result = self._select_all(query, params)
         
-        column_names = [col[0] for col in self.cursor.description]
-        return [dict(zip(column_names, row)) for row in result]
+        return [dict(row) for row in result]
         
     # ---------------- Course Management --------------------
     def create_course(self, course_id: str, title: str, credits: int,
@@ -524,68 +1238,85 @@ class AdminQueryHandler(UniversityData):
         if "credits" in updates.keys(): 
             self._validate_credit(updates["credits"]) 
             
-        valid = {"title", "credits", "dept_name", "description"}   
-        
-        invalid = set(updates.keys()) - valid 
-        if invalid: 
+        invalid = updates.keys() - _COURSE_FIELDS
+        if invalid:
             raise ValueError(f"invalid field arg: {invalid}")
 
-        set_clause = ", ".join([f"{field} = ?" for field in updates.keys()])
-        query = f"UPDATE course SET {set_clause} WHERE course_id = ?"
-        params = tuple(updates.values()) + (course_id, )
+        fields = tuple(sorted(updates))
+        query = _build_update_sql("course", "course_id = ?", fields)
+        params = tuple(updates[f] for f in fields) + (course_id,)
         
         return self._exec(query, params)
                     
     def delete_course(self, course_id: str) -> bool:
         """Delete course"""
-        exists = self._check_query(table="course", column="course_id", value=course_id)
-        if not exists: 
-            raise RecordNotFound("Course", course_id)
         query = "DELETE FROM course WHERE course_id = ?"
-        return self._exec(query, course_id)
+        result = self._exec(query, course_id)
+        if self.cursor.rowcount == 0:
+            raise RecordNotFound("Course", course_id)
+        return result
     
+    @cached_read
     def get_course_info(self, course_id: str) -> Optional[Tuple]:
         """Get course information with prerequisites"""
         query = "SELECT * FROM course WHERE course_id = ?"
-        return self._select(query, course_id, Fetch.ONE)
+        return self._select_one(query, course_id)
     
+    def iter_all_courses(self, dept_name: Optional[str] = None) -> Iterator[sqlite3.Row]:
+        """Stream all courses row by row, optionally filtered by department"""
+        if dept_name:
+            return self._select_iter('SELECT * FROM course WHERE dept_name = ?', dept_name)
+        return self._select_iter('SELECT * FROM course')
+
     def get_all_courses(self, dept_name: Optional[str] = None) -> List[Dict]:
         """Get all courses, optionally filtered by department"""
-        if dept_name: 
-            query = 'SELECT * FROM course WHERE dept_name = ?'
-            result = self._select(query, dept_name, Fetch.ALL)
-        else: 
-            result = self._select('SELECT * FROM course')
-        
-        column_names = [col[0] for col in self.cursor.description]
-        return [dict(zip(column_names, row)) for row in result]
+        return [dict(row) for row in self.iter_all_courses(dept_name)]
     
     def add_prerequisite(self, course_id: str, prereq_id: str) -> bool:
         """Add a prerequisite to a course"""
-        src_exists = self._check_query(table="course", column="course_id", value=course_id)
-        if not src_exists:  
-            raise RecordNotFound("Course", course_id)
-        prq_exists = self._check_query(table="course", column="course_id", value=prereq_id)
-        if not prq_exists: 
-            raise RecordNotFound("Course", prereq_id) 
         query = "INSERT INTO prereq VALUES (?, ?)"
-        return self._exec(query, (course_id, prereq_id))
+        try:
+            return self._exec(query, (course_id, prereq_id))
+        except DataBaseError as e:
+            # Distinguish a missing course (FK) from a duplicate pair (PK)
+            if isinstance(e.args[0], sqlite3.IntegrityError):
+                for cid in (course_id, prereq_id):
+                    if not self._check_query(table="course", column="course_id", value=cid):
+                        raise RecordNotFound("Course", cid)
+            raise
     
+    def add_prerequisites_bulk(self, pairs: List[Tuple[str, str]]) -> bool:
+        """
+        Add many (course_id, prereq_id) pairs in one transaction.
+
+        Both sides of every pair are checked up front (each course only
+        once), then the inserts run as a single executemany.
+        """
+        courses_checked = set()
+        for pair in pairs:
+            for course_id in pair:
+                if course_id not in courses_checked:
+                    if not self._check_query(table="course", column="course_id", value=course_id):
+                        raise RecordNotFound("Course", course_id)
+                    courses_checked.add(course_id)
+
+        if not pairs:
+            return True
+
+        return self._executemany_txn("INSERT INTO prereq VALUES (?, ?)", list(pairs))
+
     def remove_prerequisite(self, course_id: str, prereq_id: str) -> bool:
         """Remove a prerequisite from a course"""
-        src_exists = self._check_query(table="course", column="course_id", value=course_id)
-        if not src_exists:  
-            raise RecordNotFound("Course", course_id)
-        prq_exists = self._check_query(table="course", column="course_id", value=prereq_id)
-        if not prq_exists: 
-            raise RecordNotFound("Course", prereq_id) 
         query = "DELETE FROM prereq WHERE course_id = ? AND prereq_id = ?"
-        return self._exec(query, (course_id, prereq_id))
+        result = self._exec(query, (course_id, prereq_id))
+        if self.cursor.rowcount == 0:
+            raise RecordNotFound("Prerequisite", f"{course_id}-{prereq_id}")
+        return result
 
     def get_prerequisite(self, course_id: str) -> List: 
         """Get all prerequisites for a course"""
         query = "SELECT * FROM prereq WHERE course_id = ?"
-        return self._select(query, course_id)
+        return self._select_all(query, course_id)
     
     # ---------------- Section Management --------------------
     def create_section(self, course_id: str, sec_id: str, sem: str, 
@@ -607,65 +1338,72 @@ class AdminQueryHandler(UniversityData):
         params = (course_id, sec_id, sem, year, time_slot, room, capacity, 0)
         return self._exec(query, params)
     
-    def update_section(self, course_id: str, sec_id: str, sem: str, 
-                       year: int, **updates) -> bool:
-        """Update section information"""
-        
-        params = (course_id, sec_id, sem, year)
+    def create_sections_bulk(self, rows: List[Tuple]) -> bool:
+        """
+        Create many course sections in one transaction.
 
-        check_query = """
-            SELECT COUNT(*) 
-            FROM section 
-            WHERE course_id = ? AND sec_id = ? AND semester = ? AND academic_year = ?
+        Parameters:
+            rows: Sequence of (course_id, sec_id, sem, year, time_slot,
+                  room, capacity) tuples.
+
+        Rows are validated up front (fail fast), then inserted with a single
+        executemany and one commit.
         """
+        normalized = []
+        courses_checked = set()
+        for course_id, sec_id, sem, year, time_slot, room, capacity in rows:
+            if course_id not in courses_checked:
+                if not self._check_query(table="course", column="course_id", value=course_id):
+                    raise RecordNotFound("Course", course_id)
+                courses_checked.add(course_id)
+            self._validate_semester(sem)
+            self._validate_academic_year(year)
+            self._validate_timeslot(time_slot)
+            if capacity <= 0:
+                raise IncorrectValue("capacity", capacity)
+            normalized.append((course_id, sec_id, sem, year, time_slot, room, capacity, 0))
+
+        if not normalized:
+            return True
+
+        query = "INSERT INTO section VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+        return self._executemany_txn(query, normalized)
+
+    def update_section(self, course_id: str, sec_id: str, sem: str,
+                       year: int, **updates) -> bool:
+        """Update section information"""
         
-        self.cursor.execute(check_query, params)
-        section_exists = self.cursor.fetchone()[0]
-        
-        if not section_exists: 
-            raise RecordNotFound("Section", f"{course_id}-{sec_id}-{sem}-{year}")
-        
-        valid = {"time_slot", "room", "capacity", "enrolled"}
-        
-        invalid = set(updates.keys()) - valid 
-        if invalid: 
+        invalid = updates.keys() - _SECTION_FIELDS
+        if invalid:
             raise ValueError(f"invalid field arg: {invalid}")
         
-        set_clause = ", ".join([f"{field} = ?" for field in updates.keys()])
-        
-        query = f"""
-            UPDATE section 
-            SET {set_clause}
-            WHERE course_id = ? AND sec_id = ? AND semester = ? AND academic_year = ?
-        """
-
-        params = tuple(updates.values()) + (course_id, sec_id, sem, year)
+        fields = tuple(sorted(updates))
+        query = _build_update_sql(
+            "section",
+            "course_id = ? AND sec_id = ? AND semester = ? AND academic_year = ?",
+            fields,
+        )
+        params = tuple(updates[f] for f in fields) + (course_id, sec_id, sem, year)
 
-        return self._exec(query, params)
+        result = self._exec(query, params)
+        if self.cursor.rowcount == 0:
+            raise RecordNotFound("Section", f"{course_id}-{sec_id}-{sem}-{year}")
+        return result
     
     def delete_section(self, course_id: str, sec_id: str, sem: str, year: int) -> bool:
         """Delete section"""
         
         params = (course_id, sec_id, sem, year)
 
-        check_query = """
-            SELECT COUNT(*) 
-            FROM section 
-            WHERE course_id = ? AND sec_id = ? AND semester = ? AND academic_year = ?
-        """
-        
-        self.cursor.execute(check_query, params)
-        section_exists = self.cursor.fetchone()[0]
-        
-        if not section_exists: 
-            return RecordNotFound("Section", f"{course_id}-{sec_id}-{sem}-{year}") 
-        
         delete_query = """
-            DELETE FROM section 
+            DELETE FROM section
             WHERE course_id = ? AND sec_id = ? AND semester = ? AND academic_year = ?
         """
-        
-        return self._exec(delete_query, params)
+
+        result = self._exec(delete_query, params)
+        if self.cursor.rowcount == 0:
+            raise RecordNotFound("Section", f"{course_id}-{sec_id}-{sem}-{year}")
+        return result
     
     def assign_instructor(self, instructor_id: int, course_id: str, sec_id: str, 
                           sem: str, year: int) -> bool:
@@ -673,342 +1411,478 @@ class AdminQueryHandler(UniversityData):
         
         self._validate_semester(sem)
         self._validate_academic_year(year)
-        
-        check_query = """
-            SELECT COUNT(*)
-            FROM section
-            WHERE course_id = ? AND sec_id = ? AND semester = ? AND academic_year = ?
-        """
-        self.cursor.execute(check_query, (course_id, sec_id, sem, year))
-        sec_exists = self.cursor.fetchone()[0]
-        if not sec_exists: 
-            raise RecordNotFound("Section", f"{course_id}-{sec_id}-{sem}-{year}")
-        
-        instructor_exists = self._check_query(table="instructor", column="id", value=instructor_id)
-        if not instructor_exists:
-            raise RecordNotFound("Instructor", instructor_id)
-        
+
         params = (instructor_id, course_id, sec_id, sem, year)
         query = "INSERT INTO teaches VALUES (?, ?, ?, ?, ?)"
-        
-        return self._exec(query, params)
+
+        try:
+            return self._exec(query, params)
+        except DataBaseError as e:
+            # Could be either FK, or the teaches PK on a re-assignment;
+            # name whichever side is missing, otherwise keep the original.
+            if isinstance(e.args[0], sqlite3.IntegrityError):
+                if not self._instructor_exists(instructor_id):
+                    raise RecordNotFound("Instructor", instructor_id)
+                if self._select_one(_Q_SECTION_EXISTS, (course_id, sec_id, sem, year)) is None:
+                    raise RecordNotFound("Section", f"{course_id}-{sec_id}-{sem}-{year}")
+            raise
     
     def unassign_instructor(self, instructor_id: int, course_id: str, sec_id: str,
                             sem: str, year: int) -> bool:
         """Remove instructor from a section"""
         
-        check_query = """
-            SELECT COUNT(*)
-            FROM teaches 
-            WHERE instructor_id = ? AND course_id = ? AND sec_id = ? 
-                AND semester = ? AND academic_year = ? 
-         """
-         
-        self.cursor.execute(check_query, (instructor_id, course_id, sec_id, sem, year))
-        exists = self.cursor.fetchone()[0]
-        if not exists:
-            raise RecordNotFound(
-                "Teaches", 
-                f"{instructor_id}-{course_id}-{sec_id}-{sem}-{year}"
-            )
-        
         params = (instructor_id, course_id, sec_id, sem, year)
         delete_query = """
             DELETE FROM teaches
             WHERE instructor_id = ? AND course_id = ? AND sec_id = ?
                 AND semester = ? AND academic_year = ?
         """
-        
-        return self._exec(delete_query, params)
+
+        result = self._exec(delete_query, params)
+        if self.cursor.rowcount == 0:
+            raise RecordNotFound(
+                "Teaches",
+                f"{instructor_id}-{course_id}-{sec_id}-{sem}-{year}"
+            )
+        return result
 
     def get_section_info(self, course_id: str, sec_id: str, sem: str, year: int) -> Optional[Dict]:
         """Get section information with enrollment details"""
         
-        query = """
-            SELECT s.course_id, s.sec_id, s.semester, s.academic_year, 
-                   s.time_slot, s.room, s.capacity, s.enrolled,
-                   i.fname || ' ' || i.lname AS instructor_name
-            FROM section s
-            LEFT JOIN teaches t ON s.course_id = t.course_id 
-                                AND s.sec_id = t.sec_id 
-                                AND s.semester = t.semester 
-                                AND s.academic_year = t.academic_year
-            LEFT JOIN instructor i ON t.instructor_id = i.id
-            WHERE s.course_id = ? AND s.sec_id = ? AND s.semester = ? AND s.academic_year = ?
-            ORDER BY s.academic_year, s.semester, s.course_id, s.sec_id
+        result = self._select_one(_Q_SECTION_INFO, (course_id, sec_id, sem, year))
+        return _join_name(dict(result), "instructor_name", "instructor_") if result else None
+
+    def iter_all_sections(self, sem: str = None, year: int = None,
+                          chunk: int = 1000) -> Iterator[Dict]:
         """
-        params = (course_id, sec_id, sem, year)
-        result = self._select(query, params, Fetch.ONE)
-        
-        if result:
-            column_names = [col[0] for col in self.cursor.description]
-            return dict(zip(column_names, result))
-        return None
+        Stream sections (with course and instructor details) as dicts,
+        optionally filtered by semester and/or year.
+
+        Rows are pulled fetchmany(chunk) at a time, so a catalog-sized
+        listing never holds more than one chunk in memory and the caller
+        can start consuming before the last row exists.
+
+        Validation and the query itself run eagerly (this is a plain
+        method returning a generator, like _select_iter), so bad
+        arguments raise here rather than at the first next().
+        """
+        params = []
+
+        if sem is not None:
+            self._validate_semester(sem)
+            params.append(sem)
+
+        if year is not None:
+            self._validate_academic_year(year)
+            params.append(year)
+
+        query = _Q_ALL_SECTIONS[(sem is not None, year is not None)]
+
+        try:
+            cursor = self.conn.cursor()
+            cursor.execute(query, tuple(params))
+        except sqlite3.Error as e:
+            raise DataBaseError(e)
+
+        def stream():
+            try:
+                while True:
+                    rows = cursor.fetchmany(chunk)
+                    if not rows:
+                        break
+                    yield from (_join_name(dict(row), "instructor_name", "instructor_")
+                                for row in rows)
+            finally:
+                cursor.close()
+        return stream()
+
+    def get_all_sections(self, sem: str = None, year: int = None,
+                         raw: bool = False) -> Union[List[Dict], List[sqlite3.Row]]:
+        """
+        Get all sections with course and instructor details optionally
+        filtered by semester and/or year.
+
+        With raw=True the sqlite3.Row objects come back as-is, and a
+        caller that iterates once (e.g. a template renderer) skips one
+        dict allocation per row. Raw rows support row["title"] style
+        access but carry the split instructor_fname/instructor_lname
+        columns straight from the query — there is no synthesized
+        instructor_name; join them (or not) yourself.
+        """
+        if raw:
+            params = []
+            if sem is not None:
+                self._validate_semester(sem)
+                params.append(sem)
+            if year is not None:
+                self._validate_academic_year(year)
+                params.append(year)
+            return self._select_all(_Q_ALL_SECTIONS[(sem is not None, year is not None)],
+                                    tuple(params))
+        return list(self.iter_all_sections(sem, year))
     
-    def get_all_sections(self, sem: str = None, year: int = None) -> List[Dict]:
-        """Get all sections with course and instructor details optionally filtered by semester and/or year"""
-        
+    def get_sections_by_ids(self, ids: List[Tuple[str, str, str, int]]) -> Dict[Tuple, Dict]:
+        """
+        Fetch section info for many (course_id, sec_id, semester,
+        academic_year) keys at once.
+
+        One row-value IN (VALUES ...) query per 200-key chunk replaces a
+        loop of get_section_info calls. Returns a dict keyed by the section
+        tuple; keys with no matching section are simply absent.
+        """
+        results = {}
+        for start in range(0, len(ids), 200):
+            chunk = ids[start:start + 200]
+            values_clause = ", ".join(["(?, ?, ?, ?)"] * len(chunk))
+            query = (_Q_ALL_SECTIONS_BASE
+                     + f" WHERE (s.course_id, s.sec_id, s.semester, s.academic_year)"
+                       f" IN (VALUES {values_clause})")
+            flat = tuple(v for key in chunk for v in key)
+            for row in self._select_all(query, flat):
+                results[(row["course_id"], row["sec_id"],
+                         row["semester"], row["academic_year"])] = _join_name(
+                    dict(row), "instructor_name", "instructor_")
+        return results
+
+    def get_sections_cards(self, sem: str = None, year: int = None) -> List[Dict]:
+        """
+        Get lightweight section summaries for listing screens.
+
+        Pulls only (course_id, sec_id, semester, academic_year, title) from
+        section x course, then resolves instructor names with one batched
+        row-value IN (VALUES ...) query over exactly the sections listed —
+        two queries total instead of the full 13-column four-table join.
+        """
         query = """
-            SELECT s.course_id, s.sec_id, s.semester, s.academic_year,
-                s.time_slot, s.room, s.capacity, s.enrolled,
-                c.title, c.credits, c.dept_name,
-                i.fname || ' ' || i.lname AS instructor_name,
-                i.id AS instructor_id
+            SELECT s.course_id, s.sec_id, s.semester, s.academic_year, c.title
             FROM section s
             JOIN course c ON s.course_id = c.course_id
-            LEFT JOIN teaches t ON s.course_id = t.course_id 
-                                AND s.sec_id = t.sec_id 
-                                AND s.semester = t.semester 
-                                AND s.academic_year = t.academic_year
-            LEFT JOIN instructor i ON t.instructor_id = i.id
         """
-        
         params = []
         conditions = []
-        
         if sem is not None:
             self._validate_semester(sem)
             conditions.append("s.semester = ?")
             params.append(sem)
-        
         if year is not None:
             self._validate_academic_year(year)
             conditions.append("s.academic_year = ?")
             params.append(year)
-        
         if conditions:
             query += " WHERE " + " AND ".join(conditions)
-        
         query += " ORDER BY s.academic_year, s.semester, s.course_id, s.sec_id"
-        
-        result = self._select(query, tuple(params))
-        
-        column_names = [col[0] for col in self.cursor.description]
-        return [dict(zip(column_names, row)) for row in result]
-    
+
+        cards = [dict(row) for row in self._select_all(query, tuple(params))]
+        if not cards:
+            return cards
+
+        keys = [(c["course_id"], c["sec_id"], c["semester"], c["academic_year"])
+                for c in cards]
+        names = {}
+        # 4 bound parameters per section keeps chunks under the 999 limit
+        for start in range(0, len(keys), 200):
+            chunk = keys[start:start + 200]
+            values_clause = ", ".join(["(?, ?, ?, ?)"] * len(chunk))
+            name_query = f"""
+                SELECT t.course_id, t.sec_id, t.semester, t.academic_year,
+                       i.fname, i.lname
+                FROM teaches t
+                JOIN instructor i ON i.id = t.instructor_id
+                WHERE (t.course_id, t.sec_id, t.semester, t.academic_year)
+                      IN (VALUES {values_clause})
+            """
+            flat = tuple(v for key in chunk for v in key)
+            for row in self._select_all(name_query, flat):
+                names[(row["course_id"], row["sec_id"],
+                       row["semester"], row["academic_year"])] = \
+                    f"{row['fname']} {row['lname']}"
+
+        for card, key in zip(cards, keys):
+            card["instructor_name"] = names.get(key)
+        return cards
+
     # ---------------- Enrollment Management --------------------
+    def _term_is_current(self, sem: str, year: int) -> bool:
+        """Whether (sem, year) is the term we are currently in"""
+        now = datetime.now()
+        return (sem, year) == _current_term((now.year, now.month))
+
     def enroll_student(self, student_id: int, course_id: str, sec_id: str,
                        sem: str, year: int) -> bool:
         """Enroll student in a section"""
-        
-        def section_is_active(sec: Dict) -> bool:
-            now = datetime.now()
-            month = now.month
-            if month in [1, 2]:
-                current_month = "Winter"
-            elif month in [3, 4, 5]:
-                current_month = "Spring"  
-            elif month in [6, 7, 8]:
-                current_month = "Summer"
-            else:  
-                current_month = "Fall"
-            return sec["semester"] == current_month and sec["academic_year"] == now.year
-
-        section = self.get_section_info(course_id, sec_id, sem, year)
-        if not section:
-            raise RecordNotFound("Section", f"{course_id}-{sec_id}-{sem}-{year}")
-        if section["enrolled"] >= section["capacity"]:
-            raise ValueError("Section is full")
-        
-        if not section_is_active(section):
-            raise ValueError("Section is not active")
-        
-        student_exists = self._check_query(table="student", column="id", value=student_id)
-        if not student_exists:
-            raise RecordNotFound("Student", student_id)
-        
+
         self._validate_semester(sem)
         self._validate_academic_year(year)
+        if not self._term_is_current(sem, year):
+            raise ValueError("Section is not active")
 
-        params = (student_id, course_id, sec_id, sem, year)
-        query = """
-            INSERT INTO takes (student_id, course_id, sec_id, semester, academic_year, cancelled)
-            VALUES (?, ?, ?, ?, ?, FALSE)
-        """
-
-        if self._exec(query, params):
-            update_query = """
-                UPDATE section 
-                SET enrolled = enrolled + 1 
-                WHERE course_id = ? AND sec_id = ? AND semester = ? AND academic_year = ?
-            """
-            return self._exec(update_query, (course_id, sec_id, sem, year))
-        
-        return False
+        sec_key = (course_id, sec_id, sem, year)
+        # The conditional UPDATE reserves a seat and checks capacity in one
+        # statement; running it with the INSERT in one transaction means a
+        # single fsync per enrollment and no window for a racing enrollment
+        # to oversubscribe the section.
+        try:
+            with self.transaction():
+                self._exec(_Q_ENROLL_SEAT, sec_key)
+                if self.cursor.rowcount == 0:
+                    if self._select_one(_Q_SECTION_EXISTS, sec_key) is None:
+                        raise RecordNotFound("Section", f"{course_id}-{sec_id}-{sem}-{year}")
+                    raise ValueError("Section is full")
+                self._exec(_Q_ENROLL_INSERT, (student_id, course_id, sec_id, sem, year))
+        except DataBaseError as e:
+            # An IntegrityError here is either the student FK or the takes
+            # PK (already enrolled); only blame the student if they are
+            # actually missing.
+            if isinstance(e.args[0], sqlite3.IntegrityError):
+                if not self._check_query(table="student", column="id", value=student_id):
+                    raise RecordNotFound("Student", student_id)
+            raise
+        return True
     
     def get_enrollment_info(self, student_id: int, course_id: str, 
                             sec_id: str, sem: str, year: int) -> Optional[Dict]:
         """Get enrollment information for a student in a section"""
         
-        query = """
-            SELECT st.fname || ' ' || st.lname AS student_name,
-                   t.student_id, t.course_id, t.sec_id, t.semester, t.academic_year,
-                   t.cancelled, t.enrollment_date, t.grade,
-                   s.time_slot, s.room
-            FROM takes t
-            LEFT JOIN section s ON t.course_id = s.course_id 
-                                AND t.sec_id = s.sec_id 
-                                AND t.semester = s.semester 
-                                AND t.academic_year = s.academic_year
-            LEFT JOIN student st ON t.student_id = st.id
-            WHERE t.student_id = ? AND t.course_id = ? AND t.sec_id = ? 
-                  AND t.semester = ? AND t.academic_year = ?
-        """
         params = (student_id, course_id, sec_id, sem, year)
-        result = self._select(query, params, Fetch.ONE)
-        if result:
-            column_names = [col[0] for col in self.cursor.description]
-            return dict(zip(column_names, result))
-    
+        result = self._select_one(_Q_ENROLLMENT_INFO, params)
+        return _join_name(dict(result), "student_name", "student_") if result else None
+
     def drop_student(self, student_id: int, course_id: str, sec_id: str,
                      sem: str, year: int) -> bool:
-        """Drop student from a section"""
-        
-        section = self.get_section_info(course_id, sec_id, sem, year)
-        if not section:
-            raise RecordNotFound("Section", f"{course_id}-{sec_id}-{sem}-{year}")
-        
-        student_exists = self._check_query(table="student", column="id", value=student_id)
-        if not student_exists:
-            raise RecordNotFound("Student", student_id)
-        
-        check_query = """
-            SELECT COUNT(*)
-            FROM takes
-            WHERE student_id = ? AND course_id = ? AND sec_id = ? 
-                  AND semester = ? AND academic_year = ?
+        """Drop student from a section. Returns False if not enrolled."""
+
+        # The DELETE's rowcount already answers "was the student enrolled",
+        # so no pre-checks are needed; both statements commit together.
+        with self.transaction():
+            self._exec(_Q_DROP_DELETE, (student_id, course_id, sec_id, sem, year))
+            if self.cursor.rowcount == 0:
+                if self._select_one(_Q_SECTION_EXISTS, (course_id, sec_id, sem, year)) is None:
+                    raise RecordNotFound("Section", f"{course_id}-{sec_id}-{sem}-{year}")
+                return False
+            self._exec(_Q_DROP_SEAT, (course_id, sec_id, sem, year))
+        return True
+            
+    def enroll_students_bulk(self, rows: List[Tuple[int, str, str, str, int]]) -> bool:
         """
-        self.cursor.execute(check_query, (student_id, course_id, sec_id, sem, year))
-        is_enrolled = self.cursor.fetchone()[0]
-        if not is_enrolled:
-            return False
+        Enroll many (student_id, course_id, sec_id, semester, academic_year)
+        rows in one transaction.
 
-        params = (student_id, course_id, sec_id, sem, year) 
-        query = """
-            DELETE FROM takes
-            WHERE student_id = ? AND course_id = ? AND sec_id = ? 
-                  AND semester = ? AND academic_year = ?
+        Two executemany calls (the takes INSERTs, then the seat-count
+        UPDATEs) and a single commit replace per-row round trips. The
+        whole batch rolls back if any row hits a full section (the
+        enrolled <= capacity CHECK), a duplicate enrollment, or a missing
+        student/section.
         """
-        
-        if self._exec(query, params):
-            update_query = """
-                UPDATE section 
-                SET enrolled = enrolled - 1 
-                WHERE course_id = ? AND sec_id = ? AND semester = ? AND academic_year = ?
-            """
-            return self._exec(update_query, (course_id, sec_id, sem, year))
-            
+        if not rows:
+            return True
+        for _, _, _, sem, year in rows:
+            self._validate_semester(sem)
+            self._validate_academic_year(year)
+
+        update_query = """
+            UPDATE section
+            SET enrolled = enrolled + 1
+            WHERE course_id = ? AND sec_id = ? AND semester = ? AND academic_year = ?
+        """
+        try:
+            self.cursor.executemany(_Q_ENROLL_INSERT, rows)
+            self.cursor.executemany(update_query, [row[1:] for row in rows])
+            self.conn.commit()
+            self._bump_write_generation()
+            return True
+        except sqlite3.Error as e:
+            self.conn.rollback()
+            raise DataBaseError(e)
+
+    def drop_students_bulk(self, rows: List[Tuple[int, str, str, str, int]]) -> bool:
+        """
+        Drop many (student_id, course_id, sec_id, semester, academic_year)
+        enrollments in one transaction.
+
+        Every row must be an existing enrollment: if the batched DELETE
+        touches fewer rows than were passed in, the seat counters could
+        drift, so the batch is rolled back instead.
+        """
+        if not rows:
+            return True
+        try:
+            self.cursor.executemany(_Q_DROP_DELETE, rows)
+            if self.cursor.rowcount != len(rows):
+                self.conn.rollback()
+                raise RecordNotFound("Takes", "one or more rows in the batch")
+            self.cursor.executemany(_Q_DROP_SEAT, [row[1:] for row in rows])
+            self.conn.commit()
+            self._bump_write_generation()
+            return True
+        except sqlite3.Error as e:
+            self.conn.rollback()
+            raise DataBaseError(e)
+
+    def assign_grades_bulk(self, rows: List[Tuple[int, str, str, str, int, str]]) -> bool:
+        """
+        Assign grades for many (student_id, course_id, sec_id, semester,
+        academic_year, grade) rows in one transaction.
+
+        Rolls back (and raises RecordNotFound) if any row does not match
+        an existing enrollment.
+        """
+        if not rows:
+            return True
+        for _, _, _, sem, year, grade in rows:
+            self._validate_semester(sem)
+            self._validate_academic_year(year)
+            self._validate_grade(grade)
+
+        params_list = [(grade, sid, cid, sec, sem, year)
+                       for sid, cid, sec, sem, year, grade in rows]
+        try:
+            self.cursor.executemany(_Q_ASSIGN_GRADE, params_list)
+            if self.cursor.rowcount != len(rows):
+                self.conn.rollback()
+                raise RecordNotFound("Takes", "one or more rows in the batch")
+            self.conn.commit()
+            self._bump_write_generation()
+            return True
+        except sqlite3.Error as e:
+            self.conn.rollback()
+            raise DataBaseError(e)
+
     def assign_grade(self, student_id: int, course_id: str, sec_id: str,
                      sem: str, year: int, grade: str) -> bool:
         """Assign grade to student for a course"""
-    
-        section = self.get_section_info(course_id, sec_id, sem, year)
-        if not section:
-            raise RecordNotFound("Section", f"{course_id}-{sec_id}-{sem}-{year}")
-        
-        student_exists = self._check_query(table="student", column="id", value=student_id)
-        if not student_exists:
-            raise RecordNotFound("Student", student_id)
-        
-        params = (student_id, course_id, sec_id, sem, year)
-        check_query = """
-            SELECT COUNT(*)
-            FROM takes
-            WHERE student_id = ? AND course_id = ? AND sec_id = ?
-                  AND semester = ? AND academic_year = ?
-        """
-        take_record_exists = self.cursor.execute(check_query, params).fetchone()[0]
-        if not take_record_exists:
-            raise RecordNotFound("Takes", f"{student_id}-{course_id}-{sec_id}-{sem}-{year}")
-        
+
         self._validate_grade(grade)
         self._validate_semester(sem)
         self._validate_academic_year(year)
 
-        query = """
-            UPDATE takes
-            SET grade = ?
-            WHERE student_id = ? AND course_id = ? AND sec_id = ?
-                  AND semester = ? AND academic_year = ?
-        """
+        # The UPDATE matches on the takes primary key, which already implies
+        # the student, section and enrollment all exist — no pre-checks.
         params = (grade, student_id, course_id, sec_id, sem, year)
-        return self._exec(query, params)
+        result = self._exec(_Q_ASSIGN_GRADE, params)
+        if self.cursor.rowcount == 0:
+            raise RecordNotFound("Takes", f"{student_id}-{course_id}-{sec_id}-{sem}-{year}")
+        return result
     
     # ---------------- Advisor Management --------------------
     def assign_advisor(self, student_id: int, instructor_id: int,
                        start_date: Optional[str] = None) -> bool:
         """Assign advisor to student"""
-        
-        student_exists = self._check_query(table="student", column="id", value=student_id)
-        if not student_exists: 
-            raise RecordNotFound("Student", student_id)
-        
-        instructor_exists = self._check_query(table="instructor", column="id", value=instructor_id)
-        if not instructor_exists: 
-            raise RecordNotFound("Instructor", instructor_id)
-        
-        params = (student_id, instructor_id)
-        columns = ["student_id", "instructor_id"]
-        
-        if start_date: 
-            params += (start_date,)
-            columns.append("start_date")
-            
-        column_clause = ", ".join(columns)
-        qmarks = ", ".join(["?"] * len(columns))
-        query = f"INSERT INTO advisor({column_clause}) VALUES ({qmarks})"  
-         
-        return self._exec(query, params)
-        
+
+        if start_date:
+            self._validate_date(start_date)
+            query = _Q_INSERT_ADVISOR_DATED
+            params = (student_id, instructor_id, start_date)
+        else:
+            query = _Q_INSERT_ADVISOR
+            params = (student_id, instructor_id)
+
+        # The foreign keys do the existence checking; only a failed insert
+        # pays for the probes that name the missing side.
+        try:
+            return self._exec(query, params)
+        except DataBaseError as e:
+            if isinstance(e.args[0], sqlite3.IntegrityError):
+                if not self._instructor_exists(instructor_id):
+                    raise RecordNotFound("Instructor", instructor_id)
+                if not self._check_query(table="student", column="id", value=student_id):
+                    raise RecordNotFound("Student", student_id)
+            raise
+
     def update_advisor(self, student_id: int, new_instructor_id: int,
                     end_date: Optional[str] = None) -> bool:
         """Change student's advisor or unassign current advisor"""
-        
-        student_exists = self._check_query(table="student", column="id", value=student_id)
-        if not student_exists:
-            raise RecordNotFound("Student", student_id)
-        
-        instructor_exists = self._check_query(table="instructor", column="id", value=new_instructor_id)
-        if not instructor_exists:
-            raise RecordNotFound("Instructor", new_instructor_id)
-        
+
         if end_date:
             self._validate_date(end_date)
-                
+
         update_query = """
-            UPDATE advisor SET instructor_id = ?, end_date = ? 
+            UPDATE advisor SET instructor_id = ?, end_date = ?
             WHERE student_id = ?
         """
-        
-        return self._exec(update_query, (new_instructor_id, end_date, student_id))
+
+        try:
+            result = self._exec(update_query, (new_instructor_id, end_date, student_id))
+        except DataBaseError as e:
+            if isinstance(e.args[0], sqlite3.IntegrityError):
+                raise RecordNotFound("Instructor", new_instructor_id)
+            raise
+        if self.cursor.rowcount == 0:
+            raise RecordNotFound("Advisor", student_id)
+        return result
          
     def get_advisor_info(self, student_id: int) -> Optional[Dict]:
         """Get current advisor information for a student"""
         
         query = """
-            SELECT  s.fname || " " || s.lname AS student_name, 
-                    a.student_id, 
-                    i.fname || " " || i.lname AS advisor_name, 
-                    i.email AS advisor_email, i.office_number AS advisor_office_number, 
+            SELECT  s.fname AS student_fname, s.lname AS student_lname,
+                    a.student_id,
+                    i.fname AS advisor_fname, i.lname AS advisor_lname,
+                    i.email AS advisor_email, i.office_number AS advisor_office_number,
                     a.start_date, a.end_date
-            FROM advisor a 
+            FROM advisor a
             LEFT JOIN student s ON s.id = a.student_id
             LEFT JOIN instructor i ON i.id = a.instructor_id
             WHERE a.student_id = ?
         """
-        result = self._select(query, student_id, Fetch.ONE)
-        
-        if result:
-            column_names = [col[0] for col in self.cursor.description]
-            return dict(zip(column_names, result))
+        result = self._select_one(query, student_id)
+        if not result:
+            return None
+        info = _join_name(dict(result), "student_name", "student_")
+        return _join_name(info, "advisor_name", "advisor_")
+
+
+class MemoryAdminHandler(AdminQueryHandler):
+    """Admin handler that builds the database in memory and writes it to disk
+    once on close().
+
+    Skips page I/O and journal commits entirely while the database is being
+    built; the finished result reaches db_path as a single sequential
+    backup. Intended for bulk builds and test fixtures.
+    """
+    def __init__(self, db: str, pragmas: Optional[Dict[str, Any]] = None,
+                 deferred_indexes: bool = False):
+        self.target_path = os.path.join(os.path.dirname(__file__), db)
+        super().__init__(":memory:", pragmas, deferred_indexes)
+
+    def close(self):
+        self.conn.commit()
+        target = sqlite3.connect(self.target_path)
+        try:
+            self.conn.backup(target)
+        finally:
+            target.close()
+        self.conn.close()
 
 
 def populate(db: UniversityData, script_file: str):
+    """Run a SQL seed script inside one explicit transaction.
+
+    Without the wrapping BEGIN/COMMIT each statement commits (and fsyncs)
+    on its own, which makes bulk loads 10-50x slower than a single
+    transaction. On any error the whole load is rolled back.
+    """
     script_file = os.path.join(os.path.dirname(__file__), script_file)
     with open(script_file) as file:
         script = file.read()
-        db.cursor.executescript(script)
-    db.conn.commit()
+    # Durability is pointless mid-load: the script runs as one transaction,
+    # so a crash just means rerunning it. Dropping fsyncs and keeping the
+    # journal in memory for the duration makes fresh-DB bootstraps much
+    # faster; the handler's configured modes are restored afterwards.
+    db.conn.execute("PRAGMA synchronous = OFF")
+    db.conn.execute("PRAGMA journal_mode = MEMORY")
+    try:
+        db.cursor.executescript("BEGIN IMMEDIATE;\n" + script + "\nCOMMIT;")
+        db._bump_write_generation()
+        # The script inserts departments and instructors behind the
+        # memoized existence lookups' back.
+        db.clear_caches()
+    except sqlite3.Error as e:
+        db.conn.rollback()
+        raise DataBaseError(e)
+    finally:
+        db.conn.execute(f"PRAGMA synchronous = {db.pragmas['synchronous']}")
+        db.conn.execute(f"PRAGMA journal_mode = {db.pragmas['journal_mode']}")
+    db.ensure_indexes()
 
 
 if __name__ == "__main__":
@@ -109,13 +109,5 @@ CREATE TABLE teaches (
     FOREIGN KEY (course_id, sec_id, semester, academic_year) REFERENCES section ON DELETE CASCADE
 );
 
-/*
--- Create useful indexes for performance
-CREATE INDEX idx_student_dept ON student(dept_name);
-CREATE INDEX idx_student_email ON student(email);
-CREATE INDEX idx_instructor_dept ON instructor(dept_name);
-CREATE INDEX idx_course_dept ON course(dept_name);
-CREATE INDEX idx_takes_student ON takes(student_id);
-CREATE INDEX idx_takes_course ON takes(course_id, semester, academic_year);
-CREATE INDEX idx_section_semester ON section(semester, academic_year);
-*/;
+-- Indexes are created separately (see SCHEMA_INDEXES in db_handler.py) so
+-- bulk loads can defer them until after the data is in place.